@@ -42,12 +42,30 @@ from .container import (
     SimpleNodeStack,
     NodeStack,
     IndentedNode,
+    FrozenNode,
     NodeBlock,
     DelimitedNodeBlock,
 )
 
-from . import make
-from . import kconfig
+from importlib import import_module as _import_module
+
+# The sublanguages are imported on first access (PEP 562), so code that only
+# uses the core algebra and node layer does not pay for make/kconfig at
+# import time.  `dsl.make`, `from dsl import kconfig` and `import dsl.make`
+# all keep working.
+_SUBLANGUAGES = frozenset({"make", "kconfig"})
+
+
+def __getattr__(name: str):
+    if name in _SUBLANGUAGES:
+        module = _import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBLANGUAGES)
 
 __all__ = [
     # var language core
@@ -87,6 +105,7 @@ __all__ = [
     "SimpleNodeStack",
     "NodeStack",
     "IndentedNode",
+    "FrozenNode",
     "NodeBlock",
     "DelimitedNodeBlock",
 
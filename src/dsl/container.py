@@ -22,6 +22,10 @@ Both wrap a single child and override render():
     Used for Makefile keywords (ifdef, endif, …) that must always appear
     at column 0 regardless of nesting depth.
 
+  FrozenNode(child)             →  child's lines as first rendered
+    Snapshots the child's output per requested level and replays it, for
+    finished subtrees that are rendered repeatedly; refresh() drops them.
+
 NodeBlock composition
 ──────────────────────
 NodeBlock stores children in its ListNode._items.  __iter__ yields:
@@ -36,28 +40,109 @@ NodeBlock stores children in its ListNode._items.  __iter__ yields:
 When ContainerNode.render(lvl) iterates this, each item's own render(lvl)
 is called.  IndentedNode bumps the level so the body is indented relative
 to the header.  The begin node renders at the current level (no extra indent).
+
+Rendering itself does not go through the wrappers: render() asks each
+container for its _placements(level), i.e. (node, level) pairs, and
+NodeBlock answers with its raw children paired with level + block level.
+__iter__ (and therefore find() and subclasses that re-shape iteration)
+still sees the IndentedNode view above.
 """
-from typing import Iterable, Iterator
+from itertools import chain, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Self, Tuple
 from dsl.node import IterableNode, LevelNode, Line, ListNode, Node, nullNode
 
 class ContainerNode[TChild: Node](IterableNode[TChild]):
     """Renders by chaining render() of every child at the same level."""
 
+    __slots__ = ()
+
     def empty(self) -> bool:
         return next(iter(self), None) is None
 
     def render(self, level: int = 0) -> Iterator[Line]:
-        for child in self:
-            yield from child.render(level)
+        # Start from this container's own placements: a subclass whose
+        # render() calls super().render() must not be routed back through
+        # type(self).render by the walker.
+        return iter(_walk(self._placements(level), []))
+
+    def render_all(self, level: int = 0, out: Optional[List[Line]] = None) -> List[Line]:
+        # The root frame holds self, so a subclass with its own render() is
+        # still honoured (through _render_into).
+        if out is None:
+            out = []
+        return _walk(iter(((self, level),)), out)
+
+    def _placements(self, level: int) -> Iterator[Tuple[Node, int]]:
+        """(child, level) pairs that render(level) emits, in order.
+
+        The default places every child of __iter__ at *level*.  Containers
+        that indent some children (NodeBlock) override this to hand out the
+        target level directly instead of wrapping children in IndentedNode.
+        """
+        return zip(self, repeat(level))
 
     def find(self, *tags) -> Iterator[Node]:
-        # Search self first, then recurse into children.
-        yield from super().find(*tags)
-        for child in self:
-            yield from child.find(*tags)
+        # Pre-order search of self and its subtree, driven by an explicit
+        # stack like render(): containers using this find() are expanded in
+        # place and plain nodes are tested inline, so no generator is stacked
+        # per nesting level.
+        if not tags:
+            return
+        # The query is compiled once; each node test is then one C-level
+        # subset check instead of a generator over the tags.
+        wanted = frozenset(tags)
+        stack = [iter((self,))]
+        while stack:
+            for node in stack[-1]:
+                find = type(node).find
+                if find is ContainerNode.find:
+                    if wanted <= node._tags:
+                        yield node
+                    stack.append(iter(node))
+                    break
+                if find is Node.find:
+                    if wanted <= node._tags:
+                        yield node
+                else:
+                    yield from node.find(*tags)
+            else:
+                stack.pop()
+
+def _walk(placements: Iterator[Tuple[Node, int]], out: List[Line]) -> List[Line]:
+    """Render (node, level) *placements* into *out* and return it.
+
+    Walks the subtree with an explicit stack instead of recursing through
+    child.render(): nodes whose render() is one of the stock container
+    strategies are expanded in place and every leaf appends its lines
+    straight into *out* (_render_into), so no generator is stacked per
+    nesting level and no per-leaf iterator is built.  Each frame yields
+    (node, level) pairs (see ContainerNode._placements()).
+    """
+    stack = [placements]
+    while stack:
+        for child, lvl in stack[-1]:
+            if child is nullNode:
+                continue
+            render = type(child).render
+            if render is ContainerNode.render:
+                stack.append(child._placements(lvl))
+                break
+            if render is IndentedNode.render:
+                stack.append(zip(child, repeat(lvl + child.level)))
+                break
+            if render is FixedNode.render:
+                stack.append(zip(child, repeat(child.level)))
+                break
+            child._render_into(lvl, out)
+        else:
+            stack.pop()
+    return out
 
 class SingleContainerNode[TChild: Node](ContainerNode[TChild]):
     """Container with exactly one child."""
+
+    __slots__ = ("_child",)
+
     def __init__(self, child: TChild):
         ContainerNode.__init__(self)
         self._child = child
@@ -66,11 +151,17 @@ class SingleContainerNode[TChild: Node](ContainerNode[TChild]):
     def child(self) -> TChild:
         return self._child
 
+    def empty(self) -> bool:
+        return False
+
     def __iter__(self) -> Iterator[TChild]:
         yield self.child
 
 class IndentedNode[TChild: Node](SingleContainerNode[TChild], LevelNode):
     """Renders its child at  parent_level + self.level  (relative offset)."""
+
+    __slots__ = ("_level",)
+
     def __init__(self, child: TChild, level: int = 1):
         SingleContainerNode.__init__(self, child)
         LevelNode.__init__(self, level)
@@ -80,6 +171,9 @@ class IndentedNode[TChild: Node](SingleContainerNode[TChild], LevelNode):
 
 class FixedNode[TChild: Node](SingleContainerNode[TChild], LevelNode):
     """Renders its child at self.level regardless of the parent level."""
+
+    __slots__ = ("_level",)
+
     def __init__(self, child: TChild, level: int = 0):
         SingleContainerNode.__init__(self, child)
         LevelNode.__init__(self, level)
@@ -87,9 +181,62 @@ class FixedNode[TChild: Node](SingleContainerNode[TChild], LevelNode):
     def render(self, level: int = 0) -> Iterator[Line]:
         yield from self.child.render(self.level)
 
+class FrozenNode[TChild: Node](SingleContainerNode[TChild]):
+    """Replays the lines its child rendered at each level.
+
+    For subtrees that are finished being built and then emitted many times:
+    the child is walked once per level and later renders hand out the
+    stored lines, so absolute-level content (FixedNode, make keywords) is
+    kept exactly where the child put it.  A level already rendered does not
+    pick up later mutations of the child, while a level rendered for the
+    first time does; call refresh() after mutating to drop every snapshot.
+    """
+
+    __slots__ = ("_snapshots",)
+
+    def __init__(self, child: TChild):
+        SingleContainerNode.__init__(self, child)
+        self._snapshots: Dict[int, Tuple[Line, ...]] = {}
+
+    def refresh(self) -> Self:
+        """Drop the stored lines so the next render walks the child again."""
+        self._snapshots.clear()
+        return self
+
+    def render(self, level: int = 0) -> Iterator[Line]:
+        lines = self._snapshots.get(level)
+        if lines is None:
+            lines = self._snapshots[level] = tuple(self._child.render_all(level))
+        return iter(lines)
+
 class SimpleNodeStack[TChild: Node](ListNode[TChild], ContainerNode[TChild]):
     """Ordered list of children rendered consecutively, no separators."""
-    pass
+
+    __slots__ = ()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def __iadd__(self, other: "TChild | Iterable[TChild]") -> Self:
+        """stack += node appends one child; stack += iterable extends.
+
+        A Node is always added as a single child (a nested stack stays
+        nested); any other iterable of nodes is added with one list.extend.
+        A str, or an iterable holding anything but nodes, raises TypeError.
+        """
+        if isinstance(other, Node):
+            self._items.append(other)  # type: ignore[arg-type]
+        else:
+            if isinstance(other, str):
+                raise TypeError("Cannot add a str to a stack; wrap it in a node")
+            items = list(other)
+            for item in items:
+                if not isinstance(item, Node):
+                    raise TypeError(f"Stack children must be nodes, got {type(item).__name__}")
+            self._items.extend(items)  # type: ignore[arg-type]
+        if self._tracks_changes:
+            self._changed()
+        return self
 
 class NodeStack[TChild: Node](SimpleNodeStack[TChild]):
     """Children separated by an optional margin node.
@@ -101,27 +248,64 @@ class NodeStack[TChild: Node](SimpleNodeStack[TChild]):
     With margin=nullNode:         child0, child1, child2  (default)
     """
 
+    __slots__ = ("_margin",)
+
     def __init__(self, *children: TChild, margin: Node = nullNode):
         super().__init__(*children)
         self._margin: Node = margin
 
     def inner(self) -> Iterator[Node]:
         """The raw children, without any margin."""
-        yield from SimpleNodeStack.__iter__(self)
+        return SimpleNodeStack.__iter__(self)
 
     def iter_with_margin(self, *nodes: Node) -> Iterator[Node]:
         """Yield nodes with self._margin inserted between each pair."""
+        return self._interleave(nodes)
+
+    def _interleave(self, nodes: Iterable[Node]) -> Iterator[Node]:
+        """iter_with_margin over any iterable, without unpacking it first.
+
+        The result is built eagerly and handed out as a list iterator: the
+        sequences are short and a plain list iterator is cheaper to drive
+        than a generator.  A nullNode margin is left out entirely.
+        """
+        margin = self._margin
+        if margin is nullNode:
+            return iter(list(nodes))
         it = iter(nodes)
         first = next(it, None)
         if first is None:
-            return
-        yield first
+            return iter(())
+        out = [first]
+        append = out.append
         for child in it:
-            yield self._margin
-            yield child
+            append(margin)
+            append(child)
+        return iter(out)
 
     def __iter__(self) -> Iterator[Node]:
-        yield from self.iter_with_margin(*self.inner())
+        # Without a margin there is nothing to interleave: hand out the
+        # children's own iterator instead of driving a generator.
+        if self._margin is nullNode:
+            return self.inner()
+        return self._interleave(self.inner())
+
+    def _placements(self, level: int) -> Iterator[Tuple[Node, int]]:
+        # The margin goes in between the raw children directly, so render
+        # does not go through __iter__/_interleave; subclasses that reshape
+        # iteration fall back to the generic placement.
+        cls = type(self)
+        if cls.__iter__ is not NodeStack.__iter__ or cls.inner is not NodeStack.inner:
+            return ContainerNode._placements(self, level)
+        items = self._items
+        margin = self._margin
+        if margin is nullNode:
+            return zip(items, repeat(level))
+        if not items:
+            return iter(())
+        placed = [(margin, level)] * (2 * len(items) - 1)
+        placed[::2] = zip(items, repeat(level))
+        return iter(placed)
 
 class NodeBlock[TChild: Node, TBegin: Node](NodeStack[TChild]):
     """A header (begin) node followed by indented children.
@@ -135,6 +319,8 @@ class NodeBlock[TChild: Node, TBegin: Node](NodeStack[TChild]):
         …
     """
 
+    __slots__ = ("_begin", "_level", "_wrapped")
+
     def __init__(
         self,
         begin: TBegin,
@@ -144,20 +330,61 @@ class NodeBlock[TChild: Node, TBegin: Node](NodeStack[TChild]):
     ):
         self._begin: TBegin = begin
         self._level = level
+        self._wrapped: List[IndentedNode[TChild]] = []
         super().__init__(*children, margin=margin)
 
     @property
     def begin(self) -> TBegin:
         return self._begin
 
+    def empty(self) -> bool:
+        # The begin node is always emitted.
+        return False
+
     def inner(self) -> Iterator[Node]:
-        """Children wrapped in IndentedNode so they render one level deeper."""
-        for node in super().inner():
-            yield IndentedNode(node, self._level)
+        """Children wrapped in IndentedNode so they render one level deeper.
+
+        The wrappers are kept between calls; only positions whose child has
+        changed since the last call get a fresh IndentedNode.
+        """
+        items = self._items
+        wrapped = self._wrapped
+        level = self._level
+        del wrapped[len(items):]
+        for i, node in enumerate(items):
+            if i == len(wrapped):
+                wrapped.append(IndentedNode(node, level))
+            elif wrapped[i].child is not node:
+                wrapped[i] = IndentedNode(node, level)
+        return iter(wrapped)
+
+    def _placements(self, level: int) -> Iterator[Tuple[Node, int]]:
+        # Mirrors __iter__ without the IndentedNode wrappers; subclasses that
+        # reshape iteration fall back to the generic placement.
+        cls = type(self)
+        if cls.__iter__ is not NodeBlock.__iter__ or cls.inner is not NodeBlock.inner:
+            return ContainerNode._placements(self, level)
+        return self._block_placements(level)
+
+    def _block_placements(self, level: int) -> Iterator[Tuple[Node, int]]:
+        """begin at *level*, then each child one block level deeper."""
+        head = ((self.begin, level),)
+        body = zip(self._items, repeat(level + self._level))
+        margin = self._margin
+        if margin is nullNode:
+            return chain(head, body)
+        return chain(head, chain.from_iterable(((margin, level), pair) for pair in body))
 
     def __iter__(self) -> Iterable[Node]:
         # begin is at the current level; children are indented below it.
-        yield from self.iter_with_margin(self.begin, *self.inner())
+        yield self.begin
+        margin = self._margin
+        if margin is nullNode:
+            yield from self.inner()
+            return
+        for node in self.inner():
+            yield margin
+            yield node
 
 
 class DelimitedNodeBlock[TChild: Node, TBegin: Node, TEnd: Node](NodeBlock[TChild, TBegin]):
@@ -167,6 +394,9 @@ class DelimitedNodeBlock[TChild: Node, TBegin: Node, TEnd: Node](NodeBlock[TChil
       Makefile:  ifdef … endif,  define … endef
       Kconfig:   menu … endmenu,  if … endif,  choice … endchoice
     """
+
+    __slots__ = ("_end",)
+
     def __init__(
         self,
         begin: TBegin,
@@ -182,5 +412,20 @@ class DelimitedNodeBlock[TChild: Node, TBegin: Node, TEnd: Node](NodeBlock[TChil
     def end(self) -> TEnd:
         return self._end
 
+    def _placements(self, level: int) -> Iterator[Tuple[Node, int]]:
+        cls = type(self)
+        if cls.__iter__ is not DelimitedNodeBlock.__iter__ or cls.inner is not NodeBlock.inner:
+            return ContainerNode._placements(self, level)
+        margin = self._margin
+        if margin is nullNode:
+            tail = ((self.end, level),)
+        else:
+            tail = ((margin, level), (self.end, level))
+        return chain(self._block_placements(level), tail)
+
     def __iter__(self) -> Iterator[Node]:
-        yield from self.iter_with_margin(self.begin, *self.inner(), self.end)
+        yield from NodeBlock.__iter__(self)
+        margin = self._margin
+        if margin is not nullNode:
+            yield margin
+        yield self.end
@@ -28,35 +28,87 @@ Example (MAssignmentList):
     "CC      =  gcc"
     "LONGER  := val"
 """
-from typing import Iterator, List
+import sys
+from itertools import zip_longest
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from dsl.node import IterableNode, Line, ListNode, SupportsStr
 
 class LinesNode(IterableNode[SupportsStr]):
     """Each item returned by __iter__ becomes one indented line."""
 
+    __slots__ = ()
+
     def render(self, level: int = 0) -> Iterator[Line]:
+        out: List[Line] = []
+        self._render_into(level, out)
+        return iter(out)
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
         lvl = max(0, int(level))
-        for value in self:
-            yield Line(lvl, str(value))
+        out.extend([Line(lvl, str(value)) for value in self])
 
 class WordsNode(IterableNode[SupportsStr]):
-    """All words from __iter__ are joined into a single line using sep."""
+    """All words from __iter__ are joined into a single line using sep.
+
+    Declares no slots itself: concrete subclasses provide _sep, so the class
+    can be combined with ListNode (WordlistNode) without a layout conflict.
+    """
+
+    __slots__ = ()
 
     def __init__(self, sep: str = " ") -> None:
         super().__init__()
-        self._sep = sep
+        # Interned so the separators of a stack's rows are usually the very
+        # same object, which makes the uniform-sep check in
+        # WordAlignedContainer an identity hit.
+        self._sep = sys.intern(sep) if type(sep) is str else sep
 
     @property
     def sep(self) -> str:
         return self._sep
 
     def render(self, level: int = 0) -> Iterator[Line]:
-        yield Line(level, self._sep.join(str(word) for word in self))
+        return iter((Line(level, self._sep.join(map(str, self))),))
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        out.append(Line(level, self._sep.join(map(str, self))))
+
+# Blank lines carry no text, so the run of lines a BlankLineNode emits
+# depends only on (count, level).  One immutable tuple per pair is shared by
+# every BlankLineNode, built from one shared Line per level.  Only the usual
+# small counts and nesting depths are cached, so arbitrary caller values
+# cannot grow the tables without bound.
+_BLANK_MAX_COUNT = 8
+_BLANK_MAX_LEVEL = 32
+_BLANK_LINES: Dict[int, Line] = {}
+_BLANK_RUNS: Dict[Tuple[int, int], Tuple[Line, ...]] = {}
+
+
+def _blank_line(level: int) -> Line:
+    line = _BLANK_LINES.get(level)
+    if line is None:
+        line = Line(level, "")
+        if level < _BLANK_MAX_LEVEL:
+            _BLANK_LINES[level] = line
+    return line
+
+
+def _blank_run(count: int, level: int) -> Tuple[Line, ...]:
+    key = (count, level)
+    run = _BLANK_RUNS.get(key)
+    if run is None:
+        run = (_blank_line(max(0, int(level))),) * count
+        if count <= _BLANK_MAX_COUNT and type(level) is int and 0 <= level < _BLANK_MAX_LEVEL:
+            _BLANK_RUNS[key] = run
+    return run
+
 
 class BlankLineNode(LinesNode):
     """Vertical space: N empty lines."""
 
+    __slots__ = ("_count",)
+
     def __init__(self, lines: int = 1) -> None:
         super().__init__()
         self._count = max(0, int(lines))
@@ -69,16 +121,89 @@ class BlankLineNode(LinesNode):
         for _ in range(self._count):
             yield ""
 
+    def render(self, level: int = 0) -> Iterator[Line]:
+        if not self._count:
+            return iter(())
+        return iter(_blank_run(self._count, level))
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        if self._count:
+            out.extend(_blank_run(self._count, level))
+
 class TextNode(ListNode[SupportsStr], LinesNode):
-    """A list of strings, each rendered as one indented line."""
-    pass
+    """A list of strings, each rendered as one indented line.
+
+    When every item is a plain str the rendered lines are kept for the last
+    level asked for and replayed until the list is mutated; items of other
+    types are re-stringified on every render, as they may change.  A subclass
+    that overrides __iter__ is rendered from it and never cached.
+    """
+
+    __slots__ = ("_rendered",)
+
+    def __init__(self, *items: SupportsStr) -> None:
+        super().__init__(*items)
+        self._rendered: Optional[Tuple[int, Tuple[Line, ...]]] = None
+
+    def _changed(self) -> None:
+        self._rendered = None
+
+    def render(self, level: int = 0) -> Iterator[Line]:
+        return iter(self._lines(level))
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        out.extend(self._lines(level))
+
+    def _lines(self, level: int) -> Tuple[Line, ...]:
+        cached = self._rendered
+        if cached is not None and cached[0] == level:
+            return cached[1]
+        lvl = max(0, int(level))
+        if type(self).__iter__ is not ListNode.__iter__:
+            # An overridden __iter__ decides the lines; never cache them.
+            return tuple([Line(lvl, str(value)) for value in self])
+        items = self._items
+        lines = tuple([Line(lvl, str(value)) for value in items])
+        if all(type(value) is str for value in items):
+            self._rendered = (level, lines)
+        return lines
 
 class WordlistNode(ListNode[SupportsStr], WordsNode):
     """A list of words joined into a single line.
 
     WordlistNode("foo", "bar")  →  "foo bar"
+
+    Like TextNode, the joined line is kept while every word is a plain str
+    and dropped when the list is mutated; an overridden __iter__ is always
+    joined afresh.
     """
-    pass
+
+    __slots__ = ("_sep", "_joined")
+
+    def __init__(self, *items: SupportsStr) -> None:
+        super().__init__(*items)
+        self._joined: Optional[str] = None
+
+    def _changed(self) -> None:
+        self._joined = None
+
+    def _join(self) -> str:
+        joined = self._joined
+        if joined is None:
+            if type(self).__iter__ is not ListNode.__iter__:
+                # An overridden __iter__ decides the words; never cache them.
+                return self._sep.join(map(str, self))
+            items = self._items
+            joined = self._sep.join(map(str, items))
+            if all(type(value) is str for value in items):
+                self._joined = joined
+        return joined
+
+    def render(self, level: int = 0) -> Iterator[Line]:
+        return iter((Line(level, self._join()),))
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        out.append(Line(level, self._join()))
 
 
 # ── Column-aligned word containers ───────────────────────────────────────────
@@ -86,20 +211,14 @@ class WordlistNode(ListNode[SupportsStr], WordsNode):
 class WordAlignedContainer[TChild: WordsNode](LinesNode):
     """Aligns WordsNode children on word-column boundaries (see module doc)."""
 
-    # ── Pass-1 helpers ────────────────────────────────────────────────────
+    __slots__ = ()
 
-    @staticmethod
-    def _cell_lengths(cells: List[str]) -> List[int]:
-        return [len(c) for c in cells]
+    # ── Pass-1 helpers ────────────────────────────────────────────────────
 
     @staticmethod
-    def _compare_lengths(max_lengths: List[int], current: List[int]) -> None:
-        """Extend and update max_lengths to the element-wise maximum."""
-        for i, length in enumerate(current):
-            if i == len(max_lengths):
-                max_lengths.append(length)
-            elif length > max_lengths[i]:
-                max_lengths[i] = length
+    def _column_widths(all_cells: List[List[str]]) -> List[int]:
+        """Per-column maximum cell width across all rows (ragged rows allowed)."""
+        return [max(map(len, column)) for column in zip_longest(*all_cells, fillvalue="")]
 
     @staticmethod
     def _pad_cell(cell: str, length: int, sep: str) -> str:
@@ -109,9 +228,14 @@ class WordAlignedContainer[TChild: WordsNode](LinesNode):
         unchanged (column widths are the per-column maxima, so this only
         guards against unexpected callers).
         """
-        if len(cell) >= length:
+        if len(sep) == 1:
+            # str.ljust is a no-op for wide cells and pads in one allocation.
+            return cell.ljust(length, sep)
+        need = length - len(cell)
+        if need <= 0:
             return cell
-        return (cell + sep * length)[:length]
+        # Repeat sep just enough to cover the gap instead of a full column.
+        return cell + (sep * (need // len(sep) + 1))[:need]
 
     @classmethod
     def _pad_cells(cls, cells: List[str], lengths: List[int], sep: str) -> List[str]:
@@ -119,9 +243,12 @@ class WordAlignedContainer[TChild: WordsNode](LinesNode):
         if not cells:
             return []
         align_cols = min(len(lengths), len(cells))
-        result: List[str] = []
-        for i, c in enumerate(cells):
-            result.append(cls._pad_cell(c, lengths[i], sep) if i < align_cols else c)
+        if len(sep) == 1:
+            result = [c.ljust(w, sep) for c, w in zip(cells, lengths)]
+        else:
+            pad = cls._pad_cell
+            result = [pad(c, w, sep) for c, w in zip(cells, lengths)]
+        result.extend(cells[align_cols:])
         return result
 
     # ── LinesNode API ────────────────────────────────────────────────────────
@@ -131,44 +258,59 @@ class WordAlignedContainer[TChild: WordsNode](LinesNode):
         if not children:
             return
 
-        rows: List[List[str]] = [list(str(w) for w in c) for c in children]
-        seps: List[str]       = [c.sep for c in children]
-
-        if not any(rows):
+        # Pass 1 — one sweep over the children: read words and sep, build
+        # cells/suffix and track the widest row.  Each aligned cell is
+        # word + sep (the separator is part of the cell so padding naturally
+        # leaves a gap before the next column); the suffix is the last word.
+        all_cells:    List[List[str]] = []
+        all_suffixes: List[str]       = []
+        seps:         List[str]       = []
+        max_cols = 0
+        for child in children:
+            words = [str(w) for w in child]
+            sep = child.sep
+            if len(words) > max_cols:
+                max_cols = len(words)
+            all_cells.append([w + sep for w in words[:-1]])
+            all_suffixes.append(words[-1] if words else "")
+            seps.append(sep)
+
+        if not max_cols:
             return
-
-        max_cols = max(len(r) for r in rows)
-        if max_cols <= 1:
+        if max_cols == 1:
             # Nothing to align when every row has at most one word.
             for child in children:
                 yield str(child)
             return
+        if len(children) == 1:
+            # A lone row is its own column maximum: padding would be a no-op.
+            yield "".join(all_cells[0]) + all_suffixes[0]
+            return
 
-        # Pass 1 — build cells/suffixes and compute per-column max widths.
-        max_lengths: List[int]         = []
-        all_cells:   List[List[str]]   = []
-        all_suffixes: List[str]        = []
-
-        for words, sep in zip(rows, seps):
-            n = len(words)
-            aligned_cols = max(0, n - 1)
-            # Each aligned cell = word + sep  (the separator is part of the
-            # cell so padding naturally leaves a gap before the next column).
-            cells  = [w + sep for w in words[:aligned_cols]]
-            suffix = sep.join(words[aligned_cols:]) if words[aligned_cols:] else ""
-            all_cells.append(cells)
-            all_suffixes.append(suffix)
-            self._compare_lengths(max_lengths, self._cell_lengths(cells))
+        max_lengths = self._column_widths(all_cells)
 
         # Pass 2 — pad to column widths and emit final lines.
+        sep = seps[0]
+        if len(sep) == 1 and seps.count(sep) == len(seps):
+            # Common case: one single-char sep for the whole stack.  Every
+            # row has at most len(max_lengths) cells, so ljust over the
+            # zipped widths pads them all with no per-row helper call.
+            for cells, suffix in zip(all_cells, all_suffixes):
+                row = [c.ljust(w, sep) for c, w in zip(cells, max_lengths)]
+                row.append(suffix)
+                yield "".join(row)
+            return
+
         for cells, suffix, sep in zip(all_cells, all_suffixes, seps):
             if not cells:
                 yield suffix
             else:
                 padded = self._pad_cells(cells, max_lengths, sep)
-                yield "".join(padded) + suffix
+                padded.append(suffix)
+                yield "".join(padded)
 
 
 class WordAlignedStack[TChild: WordsNode](WordAlignedContainer[TChild], ListNode[TChild]):
     """Concrete aligned stack backed by a list (the common case)."""
-    pass
+
+    __slots__ = ()
@@ -32,30 +32,32 @@ from typing import Any
 
 class GenericArgsMixin:
 
+    __slots__ = ()
+
     _type_args: tuple[Any, ...] = ()
-    # Per-class cache so different base classes don't share specialisations.
-    _specializations: dict[tuple[Any, ...], type] = {}
+    # One shared cache keyed by (base class, arguments), so different base
+    # classes never share specialisations and a hit is a single dict lookup.
+    _specializations: dict[tuple[type, tuple[Any, ...]], type] = {}
 
     @classmethod
     def __class_getitem__(cls, params: Any) -> type:
         if not isinstance(params, tuple):
             params = (params,)
 
-        # Each subclass gets its own cache dict (not inherited from the base).
-        if "_specializations" not in cls.__dict__:
-            cls._specializations = {}
-
-        if params in cls._specializations:
-            return cls._specializations[params]
+        key = (cls, params)
+        cached = GenericArgsMixin._specializations.get(key)
+        if cached is not None:
+            return cached
 
         # Build a new class whose name encodes the arguments for readability
         # in tracebacks and repr().  _type_args is in __dict__ so the
         # __init_subclass__ guard  `"_type_args" in cls.__dict__`  can
         # distinguish this intermediate class from a user-defined subclass.
         name = f"{cls.__name__}[{', '.join(_type_repr(p) for p in params)}]"
-        subclass = type(name, (cls,), {"_type_args": params})
+        # An empty __slots__ keeps a slotted base free of a per-instance dict.
+        subclass = type(name, (cls,), {"__slots__": (), "_type_args": params})
 
-        cls._specializations[params] = subclass
+        GenericArgsMixin._specializations[key] = subclass
         return subclass
 
     @classmethod
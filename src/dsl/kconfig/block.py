@@ -37,9 +37,9 @@ class KBlock(GenericArgsMixin,DelimitedNodeBlock[KElement,KElement,TextNode]):
         super().__init__(
             begin,
             end,
+            *children,
             margin=KConfig.MARGIN,
         )
-        self.extend(children)
 
 class KSimpleBlock(KBlock):
     def __init__(self, arg: KExpr, *items:KElement):
@@ -126,15 +126,17 @@ class KOption[ConstT:KConst](GenericArgsMixin,NodeBlock[KElement,TextNode]):
         return self
 
     def add_depends(self, *conds: KExpr | str) -> "KOption[ConstT]":
+        # Build every line first and hand them over in a single extend().
+        lines = []
         for cond in conds:
-            cond = KVar.coerce(cond) if isinstance(cond, str) else cond
+            cond = self._coerce_cond(cond)
             if not KBool.isTrue(cond):
-                self._dependency_list.append(WordlistNode("depends on",cond))
+                lines.append(WordlistNode("depends on", cond))
+        self._dependency_list.extend(lines)
         return self
 
     def add_selects(self, *vars: KVar | str) -> "KOption[ConstT]":
-        for var in vars:
-            self._select_list.append(WordlistNode("select", KVar.coerce(var)))
+        self._select_list.extend([WordlistNode("select", KVar.coerce(var)) for var in vars])
         return self
 
     def add_help(self, *lines: str) -> "KOption[ConstT]":
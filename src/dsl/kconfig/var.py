@@ -43,6 +43,8 @@ kconfig=Language("kconfig")
 KExpr = VarExpr
 
 class KVar(VarName[kconfig]):
+    __slots__ = ()
+
     def __init__(self, name:str):
         if not isinstance(name, str):
             raise TypeError("Variable name must be a string")
@@ -59,6 +61,8 @@ class KVar(VarName[kconfig]):
 
 
 class KNot(VarNot[kconfig]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         c = self.child
         if isinstance(c, (KAnd, KOr)):
@@ -67,6 +71,8 @@ class KNot(VarNot[kconfig]):
 
 
 class KAnd(VarAnd[kconfig]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         l = self.left
         r = self.right
@@ -85,6 +91,8 @@ class KAnd(VarAnd[kconfig]):
 
 
 class KOr(VarOr[kconfig]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         return f"{self.left} || {self.right}"
 
@@ -93,6 +101,8 @@ from typing import Any, Union
 
 
 class KNull(VarNull[kconfig]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         return ""
 
@@ -100,6 +110,7 @@ kNULL = KNull()
 
 
 class KBool(VarBool[kconfig]):
+    __slots__ = ()
 
     def __init__(self, val: Union[str, bool, int]):
         if isinstance(val, bool):
@@ -122,6 +133,7 @@ class KBool(VarBool[kconfig]):
         return "y" if self.value else "n"
 
 class KInt(VarInt[kconfig]):
+    __slots__ = ()
 
     def __init__(self, val: Union[int, str, bool]):
         if isinstance(val, bool):
@@ -141,6 +153,7 @@ class KInt(VarInt[kconfig]):
         return str(int(self._val))
 
 class KHex(VarHex[kconfig]):
+    __slots__ = ()
 
     def __init__(self, val: Union[int, str, bool]):
         if isinstance(val, str):
@@ -158,6 +171,7 @@ class KHex(VarHex[kconfig]):
 
 
 class KString(VarString[kconfig]):
+    __slots__ = ()
 
     def __init__(self, val: Any):
         super().__init__(str(val))
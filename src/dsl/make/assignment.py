@@ -16,7 +16,7 @@ so the operators line up in a column:
     CFLAGS   ?= -O2
     BUILDDIR := build
 """
-from typing import Iterator
+from typing import ClassVar, Iterator
 
 from dsl.content import WordAlignedStack, WordsNode
 from dsl.generic_args import GenericArgsMixin
@@ -34,11 +34,20 @@ class MAssignment(GenericArgsMixin,WordsNode):
       +=   append
     """
 
+    # Bound once per specialisation (MAssignment["="], …), not per instance.
+    _op: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_type_args" in cls.__dict__:
+            cls._op = cls.get_arg(0)
+
     def __init__(self, var: MVar | str, value: MExpr | str, sep: str = " ") -> None:
+        if not self._type_args:
+            self.get_arg(0)  # raises: the operator must be bound via MAssignment[op]
         super().__init__(sep=sep)   # important: init WordsNode / Node
         self._var = MVar.coerce(var)
         self._value = MString.coerce(value)
-        self._op= self.get_arg(0)
 
     @property
     def op(self) -> str:
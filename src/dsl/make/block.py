@@ -138,5 +138,9 @@ class MConditionList(NodeStack[MCondition]):
 
         yield first.end
 
-    def __iter__(self):
-        yield from self.iter_with_margin(*self.iter_without_margin())
+    def __iter__(self) -> Iterator[Node]:
+        # The chain is tight by default, so stream it straight through
+        # instead of unpacking every branch into iter_with_margin first.
+        if self._margin is nullNode:
+            return self.iter_without_margin()
+        return self._interleave(self.iter_without_margin())
@@ -22,6 +22,8 @@ class MFunc(VarExpr[make]):
       $(name arg1,arg2,...)
     """
 
+    __slots__ = ("_name", "_args")
+
     def __init__(self, name: str, *args: MExpr):
         super().__init__()
         self._name = name
@@ -72,6 +74,8 @@ class MFunc(VarExpr[make]):
 class MIfFunc(MFunc):
     """$(if cond,then[,else])"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         cond: MExpr,
@@ -97,6 +101,8 @@ class MIfFunc(MFunc):
 class MEvalFunc(MFunc):
     """$(eval text) as an expression (expands to empty string at runtime)"""
 
+    __slots__ = ()
+
     def __init__(self, text: MExpr):
         super().__init__("eval", text)
 
@@ -104,6 +110,8 @@ class MEvalFunc(MFunc):
 class MShellFunc(MFunc):
     """$(shell text) as an expression"""
 
+    __slots__ = ()
+
     def __init__(self, text: MExpr):
         super().__init__("shell", text)
 
@@ -111,6 +119,8 @@ class MShellFunc(MFunc):
 class MCallFunc(MFunc):
     """$(call name[,arg1[,arg2...]])"""
 
+    __slots__ = ()
+
     def __init__(self, name: MVar, *args: MExpr):
         if not isinstance(name, MVar):
             raise TypeError(f"call name must be MVar, got {type(name).__name__}")
@@ -121,6 +131,8 @@ class MCallFunc(MFunc):
 class MForeachFunc(MFunc):
     """$(foreach var,list,text)"""
 
+    __slots__ = ()
+
     def __init__(self, var: MVar, items: MExpr, body: MExpr):
         if not isinstance(var, MVar):
             raise TypeError(f"foreach variable must be MVar, got {type(var).__name__}")
@@ -17,9 +17,10 @@ single if/else ifdef/else/endif chain without duplicating endif.
 Singletons MELSE_KEYWORD, MENDIF_KEYWORD, MENDEF_KEYWORD are module-level
 instances reused across all generated output.
 """
-from typing import List, cast
+from typing import ClassVar, Iterator, List, Optional, Tuple, cast
 
 from dsl.container import FixedNode
+from dsl.node import Line
 from dsl.content import WordlistNode
 from dsl.generic_args import GenericArgsMixin
 from dsl.make.var import MExpr, MVar
@@ -31,12 +32,36 @@ class MKeyword(GenericArgsMixin,FixedNode[WordlistNode]):
     The text passed here is the full line content.
     """
 
+    # The keyword is bound once per specialisation (MKeyword["ifdef"], …).
+    _name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_type_args" in cls.__dict__:
+            cls._name = cls.get_arg(0)
+
     def __init__(self,*args:str) -> None:
-        # Extract the keyword from the first token of the text
-        self._name=self.get_arg(0)
+        if not self._type_args:
+            self.get_arg(0)  # raises: the keyword must be bound via MKeyword[name]
         self._args=args
+        self._lines: Optional[Tuple[Line, ...]] = None
         FixedNode.__init__(self,WordlistNode(self._name,*args), level=0)
 
+    def render(self, level: int = 0) -> Iterator[Line]:
+        return iter(self._rendered(level))
+
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        out.extend(self._rendered(level))
+
+    def _rendered(self, level: int) -> Tuple[Line, ...]:
+        # Keywords are immutable and always sit at column 0, so the single
+        # rendered line is built once (shared singletons such as
+        # MENDIF_KEYWORD are rendered many times per file).
+        lines = self._lines
+        if lines is None:
+            lines = self._lines = tuple(FixedNode.render(self, level))
+        return lines
+
     @property
     def name(self) -> str:
         """
@@ -95,6 +120,10 @@ class MConditionKeyword(MKeyword):
     Base class for conditional directives: if, ifdef, ifndef, ifeq, ifneq, else, and else-prefixed variants.
     """
 
+    def __init__(self, *args: str) -> None:
+        super().__init__(*args)
+        self._else_form: Optional[MConditionKeyword] = None
+
     def with_else_prefix(self) -> "MConditionKeyword":
         """
         Return a new condition keyword representing the "else" form
@@ -105,6 +134,12 @@ class MConditionKeyword(MKeyword):
         - ifeq (a,b) -> else ifeq (a,b)
         - else -> else
         """
+        # Keywords are immutable, so the else form is built once and shared by
+        # every MConditionList render that reaches this branch.
+        form = self._else_form
+        if form is not None:
+            return form
+
         # Use the first token as the directive name, this matches Makefile syntax
         name = self.name
 
@@ -114,7 +149,8 @@ class MConditionKeyword(MKeyword):
         else:
             new_keyword = "else " + name
 
-        return MConditionKeyword[new_keyword](*self.args)
+        form = self._else_form = MConditionKeyword[new_keyword](*self.args)
+        return form
 
 class MSingleConditionKeyword(MConditionKeyword):
     def __init__(self,cond: MExpr):
@@ -14,7 +14,7 @@ rendered one tab-level deeper than the rule header.
 MPhony is a convenience for the common  .PHONY: target1 target2  pattern.
 """
 from abc import ABC
-from typing import Iterator, Optional
+from typing import ClassVar, Iterator, Optional
 
 from dsl.container import NodeBlock
 from dsl.content import WordsNode
@@ -43,15 +43,24 @@ class MRule(GenericArgsMixin,WordsNode, ABC):
     targets, prereqs and order_only are used as-is (no splitting).
     """
 
+    # Bound once per specialisation (MRule[":"], …), not per instance.
+    _op: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_type_args" in cls.__dict__:
+            cls._op = cls.get_arg(0)
+
     def __init__(
         self,
         targets: MExpr | str,
         prereqs: Optional[MExpr | str] = None,
         order_only: Optional[MExpr | str] = None,
     ) -> None:
+        if not self._type_args:
+            self.get_arg(0)  # raises: the operator must be bound via MRule[op]
         super().__init__(sep=" ")
 
-        self._op=self.get_arg(0)
         self._targets: MExpr = MString.coerce(targets)
         self._prereqs: Optional[MExpr] = _coerce_opt(prereqs)
         self._order_only: Optional[MExpr] = _coerce_opt(order_only)
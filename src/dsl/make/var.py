@@ -46,10 +46,14 @@ make=Language("make")
 MExpr = VarExpr
 
 class MNull(VarNull[make]):
+    __slots__ = ()
+
     def __str__(self):
         return ""
     
 class MBool(VarBool[make]):
+    __slots__ = ()
+
     def __str__(self):
         if self.value:
             return "1"
@@ -57,14 +61,18 @@ class MBool(VarBool[make]):
         return ""
     
 class MString(VarString[make]):
+    __slots__ = ()
+
     def __str__(self):
         return self.value
        
 
 class MVarName(VarName[make]):
-    pass
+    __slots__ = ()
 
 class MVar(MVarName):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, special_chars="-.")
 
@@ -72,12 +80,16 @@ class MVar(MVarName):
         return f"$({self.name})"
         
 class MArg(MVar):
+    __slots__ = ()
+
     def __init__(self, n:int):
         if not isinstance(n,int):
             raise TypeError(f"Expected int got {type(n).__name__}")
         super().__init__(str(n))
 
 class MSpecialVar(MVarName):
+    __slots__ = ()
+
     def __init__(self, name):
         if len(name)!=1:
             raise ValueError("special variable in makefile have a one character length")
@@ -97,6 +109,8 @@ class MAdd(VarAdd[make]):
         between them (when both sides are non-empty).
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _join(a: Any, b: Any) -> str:
         ls = str(a).strip()
@@ -112,6 +126,8 @@ class MAdd(VarAdd[make]):
 
 
 class MAnd(VarAnd[make]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         # Flatten nested ANDs so we can emit a single $(and a,b,c)
         terms: List[str] = []
@@ -132,6 +148,8 @@ class MAnd(VarAnd[make]):
 
 
 class MOr(VarOr[make]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         # Flatten nested ORs so we can emit a single $(or a,b,c)
         terms: List[str] = []
@@ -151,6 +169,8 @@ class MOr(VarOr[make]):
         return f"$(or {','.join(terms)})"
 
 class MNot(VarNot[make]):
+    __slots__ = ()
+
     def __str__(self) -> str:
         return f"$(if {self.child},,1)"
 
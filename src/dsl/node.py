@@ -31,7 +31,7 @@ a depth-first search and yields every node that has all the requested tags.
 Useful for post-hoc inspection of generated trees.
 """
 from abc import ABC, abstractmethod
-from typing import Iterable, Iterator, List, NamedTuple, Optional, Protocol, Self, Set, Tuple
+from typing import ClassVar, Iterable, Iterator, List, NamedTuple, Optional, Protocol, Self, Set, Tuple
 
 class SupportsStr(Protocol):
     def __str__(self) -> str:
@@ -44,15 +44,34 @@ class Line(NamedTuple):
     INDENT = "\t"
 
     def __str__(self) -> str:
-        lvl = max(0, int(self.level))
-        if not self.value or lvl <= 0:
-            return self.value
-        return self.INDENT * lvl + self.value
+        value = self.value
+        return _indent(self.level) + value if value else value
+
+
+# Indentation prefixes for the usual nesting depths, so rendering indexes a
+# table instead of repeating INDENT for every line.
+_INDENT_DEPTH = 32
+_INDENTS: Tuple[str, ...] = tuple(Line.INDENT * i for i in range(_INDENT_DEPTH))
+
+def _indent(level: int) -> str:
+    """The prefix for a line at *level*; negative levels are not indented."""
+    lvl = max(0, int(level))
+    return _INDENTS[lvl] if lvl < _INDENT_DEPTH else Line.INDENT * lvl
 
 
 # ── Core node ────────────────────────────────────────────────────────────────
 
 class Node(ABC):
+    # __weakref__ keeps nodes weakly referenceable now that they are slotted.
+    __slots__ = ("_tags", "__weakref__")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A class that redefines render() without _render_into() must not
+        # inherit a parent's fast path that would bypass its render().
+        if "render" in cls.__dict__ and "_render_into" not in cls.__dict__:
+            cls._render_into = Node._render_into
+
     def __init__(self) -> None:
         self._tags: Set[str] = set()
 
@@ -60,8 +79,27 @@ class Node(ABC):
     def render(self, level: int = 0) -> Iterator[Line]:
         ...
 
+    def _render_into(self, level: int, out: List[Line]) -> None:
+        """Append the lines of render(level) to *out*.
+
+        Containers call this for every leaf they reach, so leaves override it
+        to fill *out* directly instead of handing back an iterator.
+        """
+        out.extend(self.render(level))
+
+    def render_all(self, level: int = 0, out: Optional[List[Line]] = None) -> List[Line]:
+        """The lines of render(level) as a list, appended to *out* if given."""
+        if out is None:
+            out = []
+        self._render_into(level, out)
+        return out
+
     def __str__(self) -> str:
-        return "\n".join(str(line) for line in self.render())
+        indent = _indent
+        return "\n".join([
+            indent(level) + value if value else value
+            for level, value in self.render_all()
+        ])
 
     # ── Tags ──────────────────────────────────────────────────────────────
 
@@ -75,7 +113,7 @@ class Node(ABC):
 
     def find(self, *tags: str) -> Iterator["Node"]:
         """Depth-first search: yield nodes that carry ALL of the given tags."""
-        if tags and all(t in self._tags for t in tags):
+        if tags and self._tags.issuperset(tags):
             yield self
 
 
@@ -89,6 +127,8 @@ class NullNode(Node):
     means  `margin is nullNode`  is a cheap identity test.
     """
 
+    __slots__ = ()
+
     _instance: Optional["NullNode"] = None
 
     def __new__(cls) -> "NullNode":
@@ -98,8 +138,8 @@ class NullNode(Node):
         return cls._instance
 
     def render(self, level: int = 0) -> Iterator[Line]:
-        return
-        yield  # makes this a generator without producing any values
+        # A fresh empty iterator; cheaper than spinning up a generator frame.
+        return iter(())
 
     def __repr__(self) -> str:
         return "NullNode()"
@@ -111,6 +151,7 @@ nullNode = NullNode()
 # ── Generic list-backed node ──────────────────────────────────────────────────
 
 class IterableNode[TItem](Node, ABC):
+    __slots__ = ()
 
     @abstractmethod
     def __iter__(self) -> Iterator[TItem]:
@@ -121,32 +162,52 @@ class ListNode[TItem](IterableNode[TItem]):
 
     Subclasses decide what TItem means (other Nodes, strings, …) and how to
     render the list via render().  Mutation after construction is intentional:
-    KOption uses it to append defaults/depends lazily.
+    KOption uses it to append defaults/depends lazily.  Every mutator calls
+    _changed(), so subclasses that cache derived output can invalidate it.
     """
 
+    __slots__ = ("_items",)
+
+    # Resolved once per class: only classes that override _changed() pay for
+    # the hook call on append/extend.
+    _tracks_changes: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._tracks_changes = cls._changed is not ListNode._changed
+
     def __init__(self, *items: TItem) -> None:
         super().__init__()
         self._items: List[TItem] = list(items)
 
+    def _changed(self) -> None:
+        """Called after every mutation of the item list; no-op by default."""
+
     def append(self, item: TItem) -> Self:
         self._items.append(item)
+        if self._tracks_changes:
+            self._changed()
         return self
 
     __iadd__ = append
 
     def extend(self, items: Iterable[TItem]) -> Self:
         self._items.extend(items)
+        if self._tracks_changes:
+            self._changed()
         return self
 
     def __imul__(self, n: int) -> Self:
-        if not isinstance(n, int):
+        if type(n) is not int and not isinstance(n, int):
             raise TypeError("Repetition factor must be an int")
         if n <= 0:
             self._items.clear()
+        elif n == 1 or not self._items:
             return self
-        if n == 1 or not self._items:
-            return self
-        self._items *= n
+        else:
+            self._items *= n
+        if self._tracks_changes:
+            self._changed()
         return self
 
     repeat = __imul__
@@ -167,7 +228,12 @@ class LevelNode(Node):
     """Mixin that stores an explicit indentation level.
 
     Used by IndentedNode (relative offset) and FixedNode (absolute level).
+    Declares no slots itself: concrete subclasses provide the _level slot so
+    the mixin can sit next to another slotted base without a layout conflict.
     """
+
+    __slots__ = ()
+
     def __init__(self, level: int):
         super().__init__()
         self._level = level
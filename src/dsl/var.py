@@ -42,7 +42,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import re
-from typing import Any, ClassVar, Iterator, List, Optional, Self, Tuple, Type
+import sys
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Self, Tuple, Type
 
 from dsl.generic_args import GenericArgsMixin
 
@@ -103,8 +104,18 @@ class Language:
 # =====================================================================
 
 class VarExpr(GenericArgsMixin, ABC):
+    # Expressions are small and built in bulk by the operators and
+    # simplify(); every class in this module is slotted, so the only
+    # per-instance storage is the fields each level declares (plus
+    # __weakref__, so expressions stay weakly referenceable).
+    __slots__ = ("_key_cache", "__weakref__")
+
     # Bound Language instance per concrete class
     LANGUAGE: ClassVar[Language]
+    # LANGUAGE.types / LANGUAGE.ops, bound next to LANGUAGE so every instance
+    # reads them from its class instead of carrying its own copy.
+    types: ClassVar[LanguageTypes]
+    ops: ClassVar[LanguageOps]
 
     # ---------- language resolver ----------
 
@@ -123,13 +134,25 @@ class VarExpr(GenericArgsMixin, ABC):
                 f"got {candidate!r}"
             )
         cls.LANGUAGE = candidate
+        cls.types = candidate.types
+        cls.ops = candidate.ops
         return candidate
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Bind LANGUAGE/types/ops when the class is created: a specialisation
+        # (VarName[lang]) binds from its argument and every subclass inherits
+        # that, so classes without a registration hook (MFunc) are covered
+        # too.  Unparametrised bases (VarUnaryOp, …) stay unbound.
+        if cls._type_args:
+            cls.resolve_language()
+
     def __init__(self) -> None:
-        # Check and use the class level LANGUAGE
-        lang = type(self).resolve_language()
-        self.types: LanguageTypes = lang.types
-        self.ops: LanguageOps = lang.ops
+        # Languages are bound at class creation (see __init_subclass__); this
+        # only catches classes that never were, e.g. a bare VarName.
+        cls = type(self)
+        if type(getattr(cls, "LANGUAGE", None)) is not Language:
+            cls.resolve_language()
 
     # ---------- unified operator dispatch ----------
 
@@ -236,7 +259,12 @@ class VarExpr(GenericArgsMixin, ABC):
     # ---------- language consistency ----------
 
     def _check_same_ops(self, other: "VarExpr") -> None:
-        if type(self).resolve_language() is not type(other).resolve_language():
+        # Operands of one class trivially share its LANGUAGE; that is the
+        # common case (name & name), so skip both resolver calls for it.
+        cls = type(self)
+        if cls is type(other):
+            return
+        if cls.resolve_language() is not type(other).resolve_language():
             raise TypeError("Cannot combine expressions with different Language instances")
 
     # ---------- structural API ----------
@@ -253,8 +281,12 @@ class VarExpr(GenericArgsMixin, ABC):
         # Expressions are immutable once built, so the structural key (used by
         # __eq__, __hash__ and every simplify() pass) is computed once and
         # cached. This turns repeated key() lookups on a tree from O(n) into
-        # O(1) after the first call.
-        k = getattr(self, "_key_cache", None)
+        # O(1) after the first call.  The slot is read directly (a hit costs
+        # one attribute load); it is unset until the first key() call.
+        try:
+            k = self._key_cache
+        except AttributeError:
+            k = None
         if k is None:
             k = (self.TYPE, *self.args())  # type: ignore[attr-defined]
             self._key_cache = k
@@ -285,10 +317,14 @@ class VarExpr(GenericArgsMixin, ABC):
 # =====================================================================
 
 class VarUnaryOp(VarExpr):
+    __slots__ = ("child",)
+
     def __init__(self, child: VarExpr):
         self.child = child
         super().__init__()
-        if type(self).resolve_language() is not type(child).resolve_language():
+        # Operators already check languages in _dispatch_binop; this re-check
+        # of direct construction is a debug-build guard (elided under -O).
+        if __debug__ and type(self).LANGUAGE is not type(child).resolve_language():
             raise TypeError("Mismatched Language in unary operator")
 
     def __iter__(self) -> Iterator[VarExpr]:
@@ -299,13 +335,17 @@ class VarUnaryOp(VarExpr):
 
 
 class VarBinaryOp(VarExpr):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: VarExpr, right: VarExpr):
         self.left = left
         self.right = right
         super().__init__()
-        if type(self).resolve_language() is not type(left).resolve_language() \
-           or type(self).resolve_language() is not type(right).resolve_language():
-            raise TypeError("Mismatched Language in binary operator")
+        if __debug__:
+            lang = type(self).LANGUAGE
+            if lang is not type(left).resolve_language() \
+               or lang is not type(right).resolve_language():
+                raise TypeError("Mismatched Language in binary operator")
 
     def __iter__(self) -> Iterator[VarExpr]:
         yield self.left
@@ -332,10 +372,11 @@ class VarBinaryOp(VarExpr):
         if len(terms) == 1:
             return terms[0]
 
-        lang = type(terms[0]).resolve_language()
-        for t in terms:
-            if type(t).resolve_language() is not lang:
-                raise TypeError("Mixed Language in rebuild")
+        if __debug__:
+            lang = type(terms[0]).resolve_language()
+            for t in terms:
+                if type(t).resolve_language() is not lang:
+                    raise TypeError("Mixed Language in rebuild")
 
         terms_sorted = sorted(terms, key=lambda e: e.key())
         acc: VarExpr = terms_sorted[0]
@@ -349,6 +390,8 @@ class VarBinaryOp(VarExpr):
 # =====================================================================
 
 class VarConcrete(VarExpr):
+    __slots__ = ()
+
     # Default declaration point for TYPE
     TYPE: ClassVar[str]
 
@@ -368,9 +411,14 @@ class VarConcrete(VarExpr):
 # =====================================================================
 
 class VarConst(VarConcrete):
+    __slots__ = ("_val",)
+
     def __init__(self, val: Any):
         self._val = val
         super().__init__()
+        # Leaves are keyed in nearly every simplify() pass; build the key
+        # with the node instead of on the first key() call.
+        self._key_cache = (self.TYPE, *self.args())  # type: ignore[attr-defined]
 
     @property
     def value(self):
@@ -394,6 +442,8 @@ class VarConst(VarConcrete):
 
 
 class VarBool(VarConst):
+    __slots__ = ()
+
     TYPE = "bool"
 
     def __init_subclass__(cls, **kwargs):
@@ -406,13 +456,19 @@ class VarBool(VarConst):
     def __init__(self, val):
         super().__init__(bool(val))
 
+    # isTrue/isFalse are probed several times per simplify() call; constants
+    # are almost always exactly ``cls``, so test type identity before paying
+    # for isinstance().
+
     @classmethod
     def isTrue(cls, x: "VarExpr") -> bool:
-        return isinstance(x, cls) and x.value is True
+        t = type(x)
+        return (t is cls or isinstance(x, cls)) and x.value is True
 
     @classmethod
     def isFalse(cls, x: "VarExpr") -> bool:
-        return isinstance(x, cls) and x.value is False
+        t = type(x)
+        return (t is cls or isinstance(x, cls)) and x.value is False
 
     @classmethod
     def true(cls) -> Self:
@@ -424,6 +480,8 @@ class VarBool(VarConst):
 
 
 class VarString(VarConst):
+    __slots__ = ()
+
     TYPE = "string"
 
     def __init_subclass__(cls, **kwargs):
@@ -438,6 +496,8 @@ class VarString(VarConst):
 
 
 class VarInt(VarConst):
+    __slots__ = ()
+
     TYPE = "int"
 
     def __init_subclass__(cls, **kwargs):
@@ -452,6 +512,8 @@ class VarInt(VarConst):
 
 
 class VarHex(VarConst):
+    __slots__ = ()
+
     TYPE = "hex"
 
     def __init_subclass__(cls, **kwargs):
@@ -469,11 +531,16 @@ class VarHex(VarConst):
 
 
 class VarName(VarConcrete):
+    __slots__ = ("_name",)
+
     TYPE = "name"
 
     # Base allowed characters: letters, digits, underscore, dot
     _BASE_ALLOWED = "A-Za-z0-9_."
     _ILLEGAL_CHAR_RE = re.compile(rf"[^{_BASE_ALLOWED}]")
+    # Compiled illegal-character patterns keyed by (allowed, special_chars);
+    # MVar/MAutoVar pass the same special_chars on every construction.
+    _ILLEGAL_RE_CACHE: ClassVar[Dict[Tuple[str, str], re.Pattern[str]]] = {}
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -493,21 +560,28 @@ class VarName(VarConcrete):
         # Replace spaces with underscore
         s = s.replace(" ", "_")
 
-        # Build a regex that treats special_chars as extra allowed characters
+        # A regex that treats special_chars as extra allowed characters
+        klass = type(self)
         if special_chars:
-            extra = re.escape(special_chars)
-            klass = type(self)
-            illegal_re = re.compile(rf"[^{klass._BASE_ALLOWED}{extra}]")
+            key = (klass._BASE_ALLOWED, special_chars)
+            illegal_re = VarName._ILLEGAL_RE_CACHE.get(key)
+            if illegal_re is None:
+                extra = re.escape(special_chars)
+                illegal_re = re.compile(rf"[^{klass._BASE_ALLOWED}{extra}]")
+                VarName._ILLEGAL_RE_CACHE[key] = illegal_re
         else:
-            illegal_re = type(self)._ILLEGAL_CHAR_RE
+            illegal_re = klass._ILLEGAL_CHAR_RE
 
         m = illegal_re.search(s)
         if m:
             illegal = m.group(0)
             raise ValueError(f"Illegal character {illegal!r} in variable name")
 
-        self._name = s
+        # Interned: the same names recur throughout an expression set, and
+        # key() comparisons in simplify() then mostly hit on identity.
+        self._name = sys.intern(s)
         super().__init__()
+        self._key_cache = (self.TYPE, *self.args())
 
     @property
     def name(self) -> str:
@@ -531,6 +605,12 @@ class VarName(VarConcrete):
         wrapped as ``cls(value)``. Lets callers write ``MSet("CC", …)`` or
         ``KOptionBool("MY_OPT", …)`` instead of wrapping the name by hand.
         """
+        # Monomorphic fast paths first: an exact instance or a plain str.
+        t = type(value)
+        if t is cls:
+            return value
+        if t is str:
+            return cls(value)
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
@@ -542,6 +622,8 @@ class VarName(VarConcrete):
 
 
 class VarNull(VarConcrete):
+    __slots__ = ()
+
     TYPE = "null"
 
     _instance: Optional["VarNull"] = None
@@ -565,7 +647,8 @@ class VarNull(VarConcrete):
 
     @classmethod
     def isNull(cls, expr: "VarExpr") -> bool:
-        return isinstance(expr, cls)
+        t = type(expr)
+        return t is cls or isinstance(expr, cls)
 
 
 # =====================================================================
@@ -573,6 +656,8 @@ class VarNull(VarConcrete):
 # =====================================================================
 
 class VarNot(VarUnaryOp):
+    __slots__ = ()
+
     TYPE = "not"
 
     def __init_subclass__(cls, **kwargs):
@@ -609,6 +694,8 @@ class VarNot(VarUnaryOp):
 
 
 class VarAnd(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "and"
 
     def __init_subclass__(cls, **kwargs):
@@ -637,13 +724,12 @@ class VarAnd(VarBinaryOp):
             if bool_type is not None:
                 return bool_type.false()
 
-        terms = self._flatten_terms(left, right)
+        flat = self._flatten_terms(left, right)
+        if flat is None:
+            # A term and its negation: the contradiction was found while flattening.
+            return bool_type.false()  # type: ignore[union-attr]
 
-        early = self._detect_contradiction(terms)
-        if early is not None:
-            return early
-
-        terms = self._absorption_with_or(terms)
+        terms = self._absorption_with_or(flat)
         terms = self._negated_absorption_with_or(terms)
 
         if bool_type is None:
@@ -656,50 +742,51 @@ class VarAnd(VarBinaryOp):
             self.ops.And or type(self),  # type: ignore[arg-type]
         )
 
-    def _flatten_terms(self, a: VarExpr, b: VarExpr) -> List[VarExpr]:
-        items: List[VarExpr] = []
-        seen = set()
+    def _flatten_terms(
+        self, a: VarExpr, b: VarExpr
+    ) -> Optional[Dict[Tuple[Any, ...], VarExpr]]:
+        """Distinct operands of the And chain by key, or None on a contradiction.
 
-        def add(e: VarExpr) -> None:
-            bt = self.types.Bool
+        When the language has a Bool type, each new term is checked against
+        the keys seen so far for its negation, so a term and its complement
+        are caught in the same pass that collects them.
+        """
+        # Pre-order walk with an explicit stack (right pushed before left),
+        # so the long left-nested chains rebuild_sorted produces neither
+        # recurse nor pay a Python call per node.
+        # Insertion-ordered: the operands keep their chain order.
+        terms: Dict[Tuple[Any, ...], VarExpr] = {}
+        bt = self.types.Bool
+        stack = [b, a]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            e = pop()
+            if isinstance(e, VarAnd):
+                push(e.right)  # type: ignore[attr-defined]
+                push(e.left)  # type: ignore[attr-defined]
+                continue
             if bt is not None and bt.isTrue(e):
-                return
+                continue
             k = e.key()
-            if k not in seen:
-                seen.add(k)
-                items.append(e)
-
-        def walk(e: VarExpr) -> None:
-            if isinstance(e, VarAnd):
-                walk(e.left)
-                walk(e.right)
-            else:
-                add(e)
-
-        walk(a)
-        walk(b)
-        return items
-
-    def _detect_contradiction(self, terms: List[VarExpr]) -> Optional[VarExpr]:
-        bool_type = self.types.Bool
-        if bool_type is None:
-            return None
-
-        keys = {t.key() for t in terms}
-        for t in terms:
-            if isinstance(t, VarNot) and t.child.key() in keys:
-                return bool_type.false()
-            if not isinstance(t, VarNot) and ("not", t.key()) in keys:
-                return bool_type.false()
-        return None
+            if k in terms:
+                continue
+            if bt is not None and (
+                ("not", k) in terms
+                or (isinstance(e, VarNot) and e.child.key() in terms)  # type: ignore[attr-defined]
+            ):
+                return None
+            terms[k] = e
+        return terms
 
-    def _absorption_with_or(self, terms: List[VarExpr]) -> List[VarExpr]:
-        if not terms:
-            return terms
-        base = {t.key() for t in terms}
+    def _absorption_with_or(self, terms: Dict[Tuple[Any, ...], VarExpr]) -> List[VarExpr]:
+        # *terms* is keyed by each operand's key, so it is the membership
+        # base itself; no separate key set is built.
         kept: List[VarExpr] = []
-        for t in terms:
-            if isinstance(t, VarOr) and (t.left.key() in base or t.right.key() in base):
+        for t in terms.values():
+            if isinstance(t, VarOr) and (
+                t.left.key() in terms or t.right.key() in terms  # type: ignore[attr-defined]
+            ):
                 continue
             kept.append(t)
         return kept
@@ -742,6 +829,8 @@ class VarAnd(VarBinaryOp):
 
 
 class VarOr(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "or"
 
     def __init_subclass__(cls, **kwargs):
@@ -770,13 +859,12 @@ class VarOr(VarBinaryOp):
             if bool_type is not None:
                 return bool_type.true()
 
-        terms = self._flatten_terms(left, right)
-
-        early = self._detect_tautology(terms)
-        if early is not None:
-            return early
+        flat = self._flatten_terms(left, right)
+        if flat is None:
+            # A term and its negation: the tautology was found while flattening.
+            return bool_type.true()  # type: ignore[union-attr]
 
-        terms = self._absorption_with_and(terms)
+        terms = self._absorption_with_and(flat)
         terms = self._negated_absorption_with_and(terms)
 
         if bool_type is None:
@@ -789,50 +877,46 @@ class VarOr(VarBinaryOp):
             self.ops.Or or type(self),  # type: ignore[arg-type]
         )
 
-    def _flatten_terms(self, a: VarExpr, b: VarExpr) -> List[VarExpr]:
-        items: List[VarExpr] = []
-        seen = set()
+    def _flatten_terms(
+        self, a: VarExpr, b: VarExpr
+    ) -> Optional[Dict[Tuple[Any, ...], VarExpr]]:
+        """Distinct operands of the Or chain by key, or None on a tautology.
 
-        def add(e: VarExpr) -> None:
-            bt = self.types.Bool
+        Same walk and complement check as VarAnd._flatten_terms.
+        """
+        # Insertion-ordered: the operands keep their chain order.
+        terms: Dict[Tuple[Any, ...], VarExpr] = {}
+        bt = self.types.Bool
+        stack = [b, a]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            e = pop()
+            if isinstance(e, VarOr):
+                push(e.right)  # type: ignore[attr-defined]
+                push(e.left)  # type: ignore[attr-defined]
+                continue
             if bt is not None and bt.isFalse(e):
-                return
+                continue
             k = e.key()
-            if k not in seen:
-                seen.add(k)
-                items.append(e)
-
-        def walk(e: VarExpr) -> None:
-            if isinstance(e, VarOr):
-                walk(e.left)
-                walk(e.right)
-            else:
-                add(e)
-
-        walk(a)
-        walk(b)
-        return items
-
-    def _detect_tautology(self, terms: List[VarExpr]) -> Optional[VarExpr]:
-        bool_type = self.types.Bool
-        if bool_type is None:
-            return None
-
-        keys = {t.key() for t in terms}
-        for t in terms:
-            if isinstance(t, VarNot) and t.child.key() in keys:
-                return bool_type.true()
-            if not isinstance(t, VarNot) and ("not", t.key()) in keys:
-                return bool_type.true()
-        return None
+            if k in terms:
+                continue
+            if bt is not None and (
+                ("not", k) in terms
+                or (isinstance(e, VarNot) and e.child.key() in terms)  # type: ignore[attr-defined]
+            ):
+                return None
+            terms[k] = e
+        return terms
 
-    def _absorption_with_and(self, terms: List[VarExpr]) -> List[VarExpr]:
-        if not terms:
-            return terms
-        base = {t.key() for t in terms}
+    def _absorption_with_and(self, terms: Dict[Tuple[Any, ...], VarExpr]) -> List[VarExpr]:
+        # *terms* is keyed by each operand's key, so it is the membership
+        # base itself; no separate key set is built.
         kept: List[VarExpr] = []
-        for t in terms:
-            if isinstance(t, VarAnd) and (t.left.key() in base or t.right.key() in base):
+        for t in terms.values():
+            if isinstance(t, VarAnd) and (
+                t.left.key() in terms or t.right.key() in terms  # type: ignore[attr-defined]
+            ):
                 continue
             kept.append(t)
         return kept
@@ -879,6 +963,8 @@ class VarOr(VarBinaryOp):
 # =====================================================================
 
 class VarAdd(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "add"
 
     def __init_subclass__(cls, **kwargs):
@@ -910,17 +996,18 @@ class VarAdd(VarBinaryOp):
         return acc
 
     def _flatten_sum(self, a: VarExpr, b: VarExpr) -> List[VarExpr]:
+        # Same explicit-stack pre-order walk as VarAnd._flatten_terms.
         items: List[VarExpr] = []
-
-        def walk(e: VarExpr) -> None:
+        stack = [b, a]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            e = pop()
             if isinstance(e, VarAdd):
-                walk(e.left)
-                walk(e.right)
+                push(e.right)  # type: ignore[attr-defined]
+                push(e.left)  # type: ignore[attr-defined]
             else:
                 items.append(e)
-
-        walk(a)
-        walk(b)
         return items
 
     def _collect_linear_terms(
@@ -1047,6 +1134,8 @@ class VarAdd(VarBinaryOp):
 
 
 class VarSub(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "sub"
 
     def __init_subclass__(cls, **kwargs):
@@ -1113,6 +1202,8 @@ class VarSub(VarBinaryOp):
 
 
 class VarMul(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "mul"
 
     def __init_subclass__(cls, **kwargs):
@@ -1154,17 +1245,18 @@ class VarMul(VarBinaryOp):
         return acc
 
     def _flatten_product(self, a: VarExpr, b: VarExpr) -> List[VarExpr]:
+        # Same explicit-stack pre-order walk as VarAnd._flatten_terms.
         items: List[VarExpr] = []
-
-        def walk(e: VarExpr) -> None:
+        stack = [b, a]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            e = pop()
             if isinstance(e, VarMul):
-                walk(e.left)
-                walk(e.right)
+                push(e.right)  # type: ignore[attr-defined]
+                push(e.left)  # type: ignore[attr-defined]
             else:
                 items.append(e)
-
-        walk(a)
-        walk(b)
         return items
 
     def _collect_constant_factor(
@@ -1192,6 +1284,8 @@ class VarMul(VarBinaryOp):
 
 
 class VarDiv(VarBinaryOp):
+    __slots__ = ()
+
     TYPE = "div"
 
     def __init_subclass__(cls, **kwargs):
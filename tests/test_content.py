@@ -7,6 +7,43 @@ from dsl.content import (
 def test_textnode_one_line_per_item():
     assert str(TextNode("a", "b", "c")) == "a\nb\nc"
 
+def test_textnode_rerenders_after_mutation():
+    t = TextNode("a")
+    assert str(t) == "a"
+    t.append("b")
+    assert str(t) == "a\nb"
+    t.repeat(0)
+    assert str(t) == ""
+    t.extend(["c"])
+    assert [(ln.level, ln.value) for ln in t.render(2)] == [(2, "c")]
+
+def test_textnode_renders_from_overridden_iter():
+    from dsl.container import NodeBlock
+
+    class Upper(TextNode):
+        def __iter__(self):
+            return (str(item).upper() for item in super().__iter__())
+
+    assert str(Upper("a", "b")) == "A\nB"
+    assert str(NodeBlock(TextNode("h"), Upper("a"))) == "h\n\tA"
+
+def test_wordlist_rejoins_after_mutation():
+    w = WordlistNode("a", "b")
+    assert str(w) == "a b"
+    w.append("c")
+    assert str(w) == "a b c"
+    w += 1
+    assert [(ln.level, ln.value) for ln in w.render(1)] == [(1, "a b c 1")]
+
+def test_wordlist_joins_overridden_iter():
+    class Upper(WordlistNode):
+        def __iter__(self):
+            return (str(item).upper() for item in super().__iter__())
+
+    w = Upper("x", "y")
+    assert str(w) == "X Y"
+    assert [(ln.level, ln.value) for ln in w.render(1)] == [(1, "X Y")]
+
 def test_wordlistnode_joins_with_sep():
     assert str(WordlistNode("a", "b", "c")) == "a b c"
 
@@ -22,6 +59,18 @@ def test_blank_line_node_counts():
     assert str(BlankLineNode(3)) == "\n\n"
     assert str(BlankLineNode(0)) == ""
 
+def test_blank_line_node_render_levels():
+    lines = list(BlankLineNode(2).render(3))
+    assert [(ln.level, ln.value) for ln in lines] == [(3, ""), (3, "")]
+    assert list(BlankLineNode(1).render(-2))[0].level == 0
+
+def test_blank_line_cache_is_bounded():
+    from dsl import content
+    for n in range(100, 110):
+        assert len(list(BlankLineNode(n).render(n))) == n
+    assert all(count <= content._BLANK_MAX_COUNT for count, _ in content._BLANK_RUNS)
+    assert all(level < content._BLANK_MAX_LEVEL for level in content._BLANK_LINES)
+
 
 def test_word_aligned_stack_columns():
     stack = WordAlignedStack(
@@ -44,6 +93,14 @@ def test_word_aligned_stack_never_truncates_wide_cell():
     assert lines[0].index("=") == lines[1].index("=")
 
 
+def test_word_aligned_multichar_sep_fill():
+    a = WordlistNode("a", "1")
+    b = WordlistNode("abcd", "2")
+    a._sep = b._sep = ", "
+    # cells are "a, " / "abcd, "; the short one is filled with sep chars.
+    assert str(WordAlignedStack(a, b)) == "a, , ,1\nabcd, 2"
+
+
 def test_word_aligned_single_word_rows_passthrough():
     stack = WordAlignedStack(WordlistNode("only"), WordlistNode("one"))
     assert str(stack) == "only\none"
@@ -51,3 +108,13 @@ def test_word_aligned_single_word_rows_passthrough():
 
 def test_word_aligned_empty():
     assert str(WordAlignedStack()) == ""
+
+
+def test_render_override_is_honoured_inside_containers():
+    from dsl.container import NodeBlock
+
+    class Shout(TextNode):
+        def render(self, level=0):
+            return (line._replace(value=line.value.upper()) for line in super().render(level))
+
+    assert str(NodeBlock(TextNode("b"), Shout("x"))) == "b\n\tX"
@@ -123,6 +123,16 @@ def test_condition_chain_else_prefix():
     ))
     assert out == "ifdef A\nX=1\nelse ifdef B\nX=2\nelse\nX=3\nendif"
 
+def test_else_prefix_is_shared_across_renders():
+    kw = m.MIfDefKeyword(m.MVar("B"))
+    assert kw._else_form is None
+    assert kw.with_else_prefix() is kw.with_else_prefix()
+    chain = m.MConditionList(
+        m.MIfDef(m.MVar("A"), m.MText("X=1")),
+        m.MIfDef(m.MVar("B"), m.MText("X=2")),
+    )
+    assert str(chain) == str(chain) == "ifdef A\nX=1\nelse ifdef B\nX=2\nendif"
+
 def test_ifeq():
     out = str(m.MIfEq(m.MVar("ARCH"), m.MString("arm"), m.MText("X=1")))
     assert out == "ifeq ($(ARCH),arm)\nX=1\nendif"
@@ -4,7 +4,7 @@ import pytest
 from dsl.node import Line, NullNode, nullNode
 from dsl.content import TextNode
 from dsl.container import (
-    IndentedNode, FixedNode, NodeStack, NodeBlock, DelimitedNodeBlock,
+    IndentedNode, FixedNode, FrozenNode, NodeStack, NodeBlock, DelimitedNodeBlock,
 )
 
 
@@ -55,6 +55,37 @@ def test_fixed_node_absolute_level():
     # ignores the parent level entirely
     assert list(n.render(5))[0].level == 0
 
+def test_node_str_indents_like_line():
+    from dsl.content import WordlistNode
+    n = FixedNode(WordlistNode("a", "b"), 2.0)
+    assert str(n) == "\n".join(str(line) for line in n.render()) == "\t\ta b"
+    assert str(IndentedNode(WordlistNode("x"), -2)) == "x"
+    assert str(IndentedNode(TextNode("x"), 40)) == "\t" * 40 + "x"
+
+
+def test_frozen_node_replays_snapshot_per_level():
+    body = TextNode("a")
+    frozen = FrozenNode(NodeBlock(TextNode("b"), body))
+    assert str(NodeStack(frozen)) == "b\n\ta"
+    assert str(IndentedNode(frozen)) == "\tb\n\t\ta"
+    body.append("c")
+    assert str(frozen) == "b\n\ta"
+    assert str(IndentedNode(frozen)) == "\tb\n\t\ta"
+    frozen.refresh()
+    assert str(frozen) == "b\n\ta\n\tc"
+    assert str(IndentedNode(frozen)) == "\tb\n\t\ta\n\t\tc"
+
+
+def test_frozen_node_keeps_absolute_levels():
+    import dsl.make as m
+    fixed = FrozenNode(NodeStack(FixedNode(TextNode("top")), TextNode("x")))
+    assert str(IndentedNode(fixed, 2)) == "top\n\t\tx"
+    assert str(IndentedNode(fixed, -1)) == "top\nx"
+    cond = FrozenNode(m.MIfDef(m.MVar("A"), m.MText("X=1")))
+    block = NodeBlock(TextNode("rule:"), cond)
+    assert str(block) == str(NodeBlock(TextNode("rule:"), m.MIfDef(m.MVar("A"), m.MText("X=1"))))
+    assert str(block) == "rule:\nifdef A\n\tX=1\nendif"
+
 
 def test_nodestack_margin_between_children():
     from dsl.content import BlankLineNode
@@ -70,10 +101,35 @@ def test_nodeblock_indents_children():
     nb = NodeBlock(TextNode("head"), TextNode("c1"), TextNode("c2"))
     assert str(nb) == "head\n\tc1\n\tc2"
 
+def test_nodeblock_rerenders_after_mutation():
+    nb = NodeBlock(TextNode("head"), TextNode("c1"), TextNode("c2"))
+    assert str(nb) == "head\n\tc1\n\tc2"
+    nb.append(TextNode("c3"))
+    assert str(nb) == "head\n\tc1\n\tc2\n\tc3"
+    nb.repeat(0)
+    assert str(nb) == "head"
+
 
 def test_delimited_block_appends_end():
     blk = DelimitedNodeBlock(TextNode("begin"), TextNode("end"), TextNode("body"))
     assert str(blk) == "begin\n\tbody\nend"
+    assert nullNode not in list(blk)
+    assert list(blk)[-1] is blk.end
+
+
+def test_block_render_and_iter_use_begin_end_properties():
+    class Renamed(DelimitedNodeBlock):
+        @property
+        def begin(self):
+            return TextNode("BEGIN")
+
+        @property
+        def end(self):
+            return TextNode("END")
+
+    blk = Renamed(TextNode("begin"), TextNode("end"), TextNode("body"))
+    assert str(blk) == "BEGIN\n\tbody\nEND"
+    assert [str(node) for node in blk] == ["BEGIN", "\tbody", "END"]
 
 
 def test_find_by_tags():
@@ -82,3 +138,79 @@ def test_find_by_tags():
     found = list(nb.find("target"))
     assert found == [inner]
     assert list(nb.find("nope")) == []
+
+
+def test_find_is_preorder_through_nested_blocks():
+    a = TextNode("a").addTags("t")
+    b = TextNode("b").addTags("t", "x")
+    inner = NodeBlock(TextNode("inner").addTags("t"), b)
+    outer = NodeBlock(TextNode("outer"), a, inner.addTags("t"), margin=TextNode("-"))
+    assert list(outer.find("t")) == [a, inner, inner.begin, b]
+    assert list(outer.find("t", "x")) == [b]
+    assert list(outer.find()) == []
+
+
+def test_container_empty():
+    assert NodeStack().empty()
+    assert not NodeStack(TextNode("a")).empty()
+    assert not NodeBlock(TextNode("head")).empty()
+    assert not IndentedNode(TextNode("x")).empty()
+
+
+def test_container_render_override_can_call_super():
+    class Upper(NodeStack):
+        def render(self, level=0):
+            for ln in super().render(level):
+                yield Line(ln.level, ln.value.upper())
+
+    assert str(Upper(TextNode("a"), TextNode("b"))) == "A\nB"
+    assert str(NodeBlock(TextNode("h"), Upper(TextNode("c")))) == "h\n\tC"
+
+
+def test_render_all_appends_to_out():
+    out = [Line(0, "pre")]
+    nb = NodeBlock(TextNode("head"), TextNode("c"))
+    assert nb.render_all(1, out) is out
+    assert [(ln.level, ln.value) for ln in out] == [(0, "pre"), (1, "head"), (2, "c")]
+    assert TextNode("x").render_all() == [Line(0, "x")]
+
+
+def test_stack_iadd_node_or_iterable():
+    ns = NodeStack(TextNode("a"))
+    ns += TextNode("b")
+    ns += [TextNode("c"), TextNode("d")]
+    ns += (n for n in [TextNode("e")])
+    assert str(ns) == "a\nb\nc\nd\ne"
+    inner = NodeStack(TextNode("x"), TextNode("y"))
+    ns += inner
+    assert ns[-1] is inner and len(ns) == 6
+    assert str(ns) == "a\nb\nc\nd\ne\nx\ny"
+
+
+def test_stack_iadd_rejects_non_nodes():
+    ns = NodeStack(TextNode("a"))
+    with pytest.raises(TypeError):
+        ns += "abc"
+    with pytest.raises(TypeError):
+        ns += [TextNode("b"), "c"]
+    assert str(ns) == "a"
+
+def test_stack_mutators_call_overridden_changed_hook():
+    class Counting(NodeStack):
+        __slots__ = ("calls",)
+
+        def __init__(self, *children):
+            self.calls = 0
+            super().__init__(*children)
+
+        def _changed(self):
+            self.calls += 1
+
+    ns = Counting(TextNode("a"))
+    ns += TextNode("b")
+    ns += [TextNode("c")]
+    ns *= 2
+    ns *= 1
+    ns *= 0
+    assert ns.calls == 4 and not ns._items
+    assert NodeStack._tracks_changes is False and Counting._tracks_changes is True
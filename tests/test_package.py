@@ -0,0 +1,97 @@
+"""Package-level behaviour: lazy sublanguage imports and slotted instances."""
+import os
+import subprocess
+import sys
+import weakref
+
+import pytest
+
+import dsl
+import dsl.kconfig as k
+import dsl.make as m
+from dsl import Language, VarAnd, VarBool, VarName, VarNot, VarOr
+from dsl.container import DelimitedNodeBlock, FixedNode, IndentedNode, NodeBlock, NodeStack
+from dsl.content import BlankLineNode, TextNode, WordAlignedStack, WordlistNode
+
+
+def test_sublanguages_are_imported_on_first_access():
+    script = (
+        "import sys, dsl\n"
+        "assert 'dsl.make' not in sys.modules and 'dsl.kconfig' not in sys.modules\n"
+        "assert 'importlib' not in vars(dsl)\n"
+        "dsl.make\n"
+        "assert 'dsl.make' in sys.modules and 'dsl.kconfig' not in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(dsl.__file__)))
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+
+# A language whose classes add `__slots__ = ()` gets dict-free instances too.
+S = Language("slots")
+
+class SName(VarName[S]):
+    __slots__ = ()
+    def __str__(self): return self.name
+
+class SNot(VarNot[S]):
+    __slots__ = ()
+    def __str__(self): return f"!{self.child}"
+
+class SAnd(VarAnd[S]):
+    __slots__ = ()
+    def __str__(self): return f"({self.left} & {self.right})"
+
+class SOr(VarOr[S]):
+    __slots__ = ()
+    def __str__(self): return f"({self.left} | {self.right})"
+
+class SBool(VarBool[S]):
+    __slots__ = ()
+    def __str__(self): return str(self.value)
+
+
+_SLOTTED = {
+    # nodes
+    "NodeStack": lambda: NodeStack(TextNode("a")),
+    "NodeBlock": lambda: NodeBlock(TextNode("head"), TextNode("a")),
+    "DelimitedNodeBlock": lambda: DelimitedNodeBlock(TextNode("begin"), TextNode("end")),
+    "IndentedNode": lambda: IndentedNode(TextNode("x")),
+    "FixedNode": lambda: FixedNode(TextNode("x")),
+    "TextNode": lambda: TextNode("a"),
+    "WordlistNode": lambda: WordlistNode("a"),
+    "BlankLineNode": lambda: BlankLineNode(),
+    "WordAlignedStack": lambda: WordAlignedStack(),
+    # language classes declaring __slots__ = ()
+    "SName": lambda: SName("A"),
+    "SBool": lambda: SBool(True),
+    "SNot": lambda: SNot(SName("A")),
+    "SAnd": lambda: SAnd(SName("A"), SName("B")),
+    "SOr": lambda: SName("A") | SName("B"),
+    # make
+    "MVar": lambda: m.MVar("A"),
+    "MAnd": lambda: m.MVar("A") & m.MVar("B"),
+    "MOr": lambda: m.MVar("A") | m.MVar("B"),
+    "MNot": lambda: ~m.MVar("A"),
+    "MAdd": lambda: m.MString("x") + m.MVar("A"),
+    "MSpecialVar": lambda: m.mTargetVar,
+    "MShellFunc": lambda: m.MShellFunc(m.MVar("A")),
+    # kconfig
+    "KVar": lambda: k.KVar("A"),
+    "KAnd": lambda: k.KVar("A") & k.KVar("B"),
+    "KOr": lambda: k.KVar("A") | k.KVar("B"),
+    "KNot": lambda: ~k.KVar("A"),
+    "KBool": lambda: k.KBool(True),
+    "KInt": lambda: k.KInt(1),
+    "KHex": lambda: k.KHex(16),
+    "KString": lambda: k.KString("s"),
+    "KNull": lambda: k.kNULL,
+}
+
+
+@pytest.mark.parametrize("make", _SLOTTED.values(), ids=_SLOTTED.keys())
+def test_instances_are_slotted(make):
+    obj = make()
+    assert not hasattr(obj, "__dict__"), type(obj).__name__
+    assert weakref.ref(obj)() is obj
+    with pytest.raises(AttributeError):
+        obj.extra = 1
@@ -102,6 +102,16 @@ def test_invert_null_is_null(lang):
 
 # ── Equality, hashing, structure ──────────────────────────────────────────────
 
+def test_flatten_handles_chains_deeper_than_recursion_limit(lang):
+    import sys
+    depth = sys.getrecursionlimit() + 100
+    names = [lang.Name(f"V{i}") for i in range(depth)]
+    chain = names[0]
+    for n in names[1:]:
+        chain = lang.And(chain, n)
+    terms = lang.And(chain, names[0])._flatten_terms(chain, names[0])
+    assert list(terms.values()) == names
+
 def test_structural_equality(abc, lang):
     A, B, _ = abc
     assert lang.Name("x") == lang.Name("x")
@@ -1,7 +1,7 @@
 """Language binding, registration, validation, and generic-arg machinery."""
 import pytest
 
-from dsl import Language, VarBool, VarName, VarNot, VarAnd, VarOr, VarNull
+from dsl import Language, VarBool, VarExpr, VarName, VarNot, VarAnd, VarOr, VarNull
 from dsl.generic_args import GenericArgsMixin
 
 
@@ -58,6 +58,15 @@ def test_cross_language_combination_rejected():
         N1("a") & N2("b")
 
 
+def test_language_bound_at_class_creation():
+    lng = Language("eager")
+
+    class F(VarExpr[lng]):  # no registration hook, like MFunc
+        ...
+
+    assert F.LANGUAGE is lng
+    assert F.ops is lng.ops and F.types is lng.types
+
 def test_varnull_must_be_subclassed():
     with pytest.raises(TypeError):
         VarNull()
@@ -85,6 +94,18 @@ def test_generic_args_specialization_is_cached_and_real_subclass():
     assert A.get_arg(0) == "="
 
 
+def test_generic_args_cache_is_per_base_class():
+    class Base(GenericArgsMixin):
+        pass
+
+    class Other(GenericArgsMixin):
+        pass
+
+    assert Base["="] is not Other["="]
+    assert issubclass(Other["="], Other)
+    assert not issubclass(Other["="], Base)
+
+
 def test_get_arg_errors():
     class Base(GenericArgsMixin):
         pass
@@ -94,3 +115,16 @@ def test_get_arg_errors():
 
     with pytest.raises(IndexError):
         Base["x"].get_arg(5)    # out of range
+
+
+def test_type_probes_accept_registered_virtual_subclasses():
+    class Truthy:
+        value = True
+
+    lng = Language("virtual")
+
+    class B(VarBool[lng]):
+        def __str__(self): return str(self.value)
+
+    B.register(Truthy)
+    assert B.isTrue(Truthy()) and not B.isFalse(Truthy())